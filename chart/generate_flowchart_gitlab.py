@@ -1,52 +1,53 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 import os
-from graphviz import Digraph
+import graphviz
 
 # Error checking
 outputs_dir = '../outputs'
 os.makedirs(outputs_dir, exist_ok=True)
 
-
-# Create a Digraph object
-dot = Digraph(comment='CI/CD Pipeline Flowchart')
-
-# Define graph aesthetics
-dot.attr(rankdir='LR', size='10')
-
-# Add nodes for the stages
-stages = ['Build', 'Test', 'Release', 'Quality', 'Package', 'Images']
-for stage in stages:
-    dot.node(stage, shape='rectangle')
-
-# Add nodes for specific jobs with conditions
-dot.node('Workflow Rules', shape='diamond')
-dot.node('Build FSW', shape='ellipse')
-dot.node('Build Docs', shape='ellipse')
-dot.node('Unit Tests', shape='ellipse')
-dot.node('Acceptance Tests', shape='ellipse')
-dot.node('Release', shape='ellipse', style='filled', fillcolor='lightgrey')
-dot.node('Quality Checks', shape='ellipse')
-dot.node('Package Petalinux', shape='ellipse')
-dot.node('Build Docker Images', shape='ellipse')
-dot.node('Build Board', shape='ellipse')
-
-# Add edges to illustrate the flow
-dot.edge('Workflow Rules', 'Build')
-dot.edge('Build', 'Test')
-dot.edge('Test', 'Release')
-dot.edge('Build', 'Build FSW')
-dot.edge('Build', 'Build Docs')
-dot.edge('Test', 'Unit Tests')
-dot.edge('Test', 'Acceptance Tests')
-dot.edge('Release', 'Quality Checks')
-dot.edge('Quality', 'Package')
-dot.edge('Package', 'Package Petalinux')
-dot.edge('Package Petalinux', 'Images')
-dot.edge('Images', 'Build Docker Images')
-dot.edge('Release', 'Build Board')
+# The whole graph as one pre-written DOT string — skips building a Digraph
+# node/edge at a time through graphviz-python's attribute quoting.
+DOT_SRC = """\
+// CI/CD Pipeline Flowchart
+digraph {
+    rankdir=LR
+    size=10
+
+    // Stages
+    node [shape=rectangle]
+    Build Test Quality Package Images
+
+    // Specific jobs with conditions
+    "Workflow Rules" [shape=diamond]
+    node [shape=ellipse]
+    "Build FSW"
+    "Build Docs"
+    "Unit Tests"
+    "Acceptance Tests"
+    Release [style=filled fillcolor=lightgrey]
+    "Quality Checks"
+    "Package Petalinux"
+    "Build Docker Images"
+    "Build Board"
+
+    // The flow
+    "Workflow Rules" -> Build
+    Build -> Test
+    Test -> Release
+    Build -> "Build FSW"
+    Build -> "Build Docs"
+    Test -> "Unit Tests"
+    Test -> "Acceptance Tests"
+    Release -> "Quality Checks"
+    Quality -> Package
+    Package -> "Package Petalinux"
+    "Package Petalinux" -> Images
+    Images -> "Build Docker Images"
+    Release -> "Build Board"
+}
+"""
 
 # Output the graph to a file and display it
-dot.format = 'png'
 output_path = os.path.join(outputs_dir, 'cicd_pipeline_flowchart')
-dot.render(output_path, view=True)
+source = graphviz.Source(DOT_SRC, format='png', engine='dot')
+source.render(output_path, view=True, cleanup=True)
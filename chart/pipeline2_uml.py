@@ -32,20 +32,12 @@ data = {
   }
 }
 
-uml = "@startuml\n"
-uml += f"class {data['name']} {{\n"
-
-for key, value in data['attributes'].items():
-    if isinstance(value, list):
-        uml += f"  {key}: {value}\n"
-    elif isinstance(value, dict):
-        uml += f"  {key}: {json.dumps(value)}\n"
-    else:
-        uml += f"  {key}: {value}\n"
-
-uml += "}\n"
-uml += "@enduml"
+# Build the UML in one join instead of repeated string concatenation;
+# json.dumps uniformly so lists and dicts render the same way.
+lines = ["@startuml", f"class {data['name']} {{"]
+lines.extend(f"  {key}: {json.dumps(value)}" for key, value in data['attributes'].items())
+lines.extend(["}", "@enduml"])
 
 # Save the UML to a file
 with open('diagram.puml', 'w') as file:
-    file.write(uml)
+    file.write("\n".join(lines))
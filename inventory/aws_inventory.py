@@ -1,81 +1,164 @@
+import argparse
+import functools
+import json
+import sys
+import threading
 import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# JSON output: prefer orjson when installed (3-10x faster, emits bytes).
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+MAX_WORKERS = 16
+
+# Adaptive retry mode does client-side rate limiting + exponential backoff,
+# so the parallel fan-out doesn't trip AWS throttling on large accounts.
+CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=3,
+    read_timeout=30,
+)
+
+# One session for the whole run; client construction (credential resolution,
+# service model load) is expensive, so cache clients per (service, region).
+SESSION = boto3.session.Session()
+
+# boto3 Sessions are not thread-safe for client creation, and lru_cache does
+# not serialize concurrent misses, so construction is guarded by a lock.
+_CLIENT_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _build_client(service, region):
+    return SESSION.client(service, region_name=region, config=CLIENT_CONFIG)
+
+def get_client(service, region=None):
+    with _CLIENT_LOCK:
+        return _build_client(service, region)
 
 # List all available AWS services
 def list_all_services():
-    session = boto3.session.Session()
-    services = session.get_available_services()
+    services = SESSION.get_available_services()
     print("Available AWS Services:")
     for service in services:
         print(f"  - {service}")
 
-# List of all regions
+# List of all regions (static per process, so only ask once)
+@functools.lru_cache(maxsize=1)
 def get_all_regions():
-    ec2 = boto3.client('ec2')
-    response = ec2.describe_regions()
-    regions = [region['RegionName'] for region in response['Regions']]
+    try:
+        ec2 = get_client('ec2')
+        response = ec2.describe_regions()
+        regions = [region['RegionName'] for region in response['Regions']]
+    except (BotoCoreError, ClientError) as error:
+        # Offline/restricted fallback: the partition data bundled with boto3
+        # knows the region list without any API round-trip. Note it includes
+        # opt-in regions the account may not have enabled.
+        print(f"describe_regions failed ({error}); "
+              "falling back to boto3 partition data", file=sys.stderr)
+        regions = SESSION.get_available_regions('ec2')
     return regions
 
+# Fan a per-region call out across a thread pool. Clients come from the
+# shared cache (boto3 clients are safe to share once built), and results come
+# back as (region, response) tuples so the caller can print serially.
+def _scan_regions(service, fn, regions=None):
+    if regions is None:
+        regions = get_all_regions()
+    def scan(region):
+        return region, fn(get_client(service, region))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(scan, region) for region in regions]
+        for future in as_completed(futures):
+            yield future.result()
+
+# Stream one {'region': ..., 'resources': ...} object per line to stdout;
+# datetimes in AWS responses are stringified via default=str.
+def _dump_json(obj):
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj, default=str) + b'\n')
+    else:
+        json.dump(obj, sys.stdout, default=str)
+        sys.stdout.write('\n')
+
+
 # EC2 instances across all regions
-def list_ec2_instances():
-    regions = get_all_regions()
-    for region in regions:
-        ec2 = boto3.client('ec2', region_name=region)
-        instances = ec2.describe_instances()
+def list_ec2_instances(regions=None, as_json=False):
+    for region, instances in _scan_regions('ec2', lambda c: c.describe_instances(), regions):
+        if as_json:
+            _dump_json({'region': region, 'resources': instances})
+            continue
         print(f"EC2 Instances in region: {region}")
         for reservation in instances['Reservations']:
             for instance in reservation['Instances']:
                 print(f"  - Instance ID: {instance['InstanceId']} State: {instance['State']['Name']}")
 
 # S3 buckets (S3 is global, not regional)
-def list_s3_buckets():
-    s3 = boto3.client('s3')
+def list_s3_buckets(as_json=False):
+    s3 = get_client('s3')
     buckets = s3.list_buckets()
+    if as_json:
+        _dump_json({'region': None, 'resources': buckets})
+        return
     print("S3 Buckets (Global):")
     for bucket in buckets['Buckets']:
         print(f"  - {bucket['Name']}")
 
 # RDS instances across all regions
-def list_rds_instances():
-    regions = get_all_regions()
-    for region in regions:
-        rds = boto3.client('rds', region_name=region)
-        instances = rds.describe_db_instances()
+def list_rds_instances(regions=None, as_json=False):
+    for region, instances in _scan_regions('rds', lambda c: c.describe_db_instances(), regions):
+        if as_json:
+            _dump_json({'region': region, 'resources': instances})
+            continue
         print(f"RDS Instances in region: {region}")
         for db_instance in instances['DBInstances']:
             print(f"  - DBInstanceIdentifier: {db_instance['DBInstanceIdentifier']}")
 
 # Lambda functions across all regions
-def list_lambda_functions():
-    regions = get_all_regions()
-    for region in regions:
-        lambda_client = boto3.client('lambda', region_name=region)
-        functions = lambda_client.list_functions()
+def list_lambda_functions(regions=None, as_json=False):
+    for region, functions in _scan_regions('lambda', lambda c: c.list_functions(), regions):
+        if as_json:
+            _dump_json({'region': region, 'resources': functions})
+            continue
         print(f"Lambda Functions in region: {region}")
         for function in functions['Functions']:
             print(f"  - {function['FunctionName']}")
 
 # CloudFormation stacks across all regions
-def list_cloudformation_stacks():
-    regions = get_all_regions()
-    for region in regions:
-        cloudformation = boto3.client('cloudformation', region_name=region)
-        stacks = cloudformation.describe_stacks()
+def list_cloudformation_stacks(regions=None, as_json=False):
+    for region, stacks in _scan_regions('cloudformation', lambda c: c.describe_stacks(), regions):
+        if as_json:
+            _dump_json({'region': region, 'resources': stacks})
+            continue
         print(f"CloudFormation Stacks in region: {region}")
         for stack in stacks['Stacks']:
             print(f"  - {stack['StackName']}")
 
 # Workspaces across all regions
-def list_workspaces():
-    regions = get_all_regions()
-    for region in regions:
-        workspace_client = boto3.client('workspaces', region_name=region)
-        workspace = workspace_client.list_somethings()
+def list_workspaces(regions=None):
+    for region, workspaces in _scan_regions('workspaces', lambda c: c.describe_workspaces(), regions):
+        print(f"Workspaces in region: {region}")
+        for workspace in workspaces['Workspaces']:
+            print(f"  - Workspace ID: {workspace['WorkspaceId']}")
 
 # Run all the inventory functions
 if __name__ == '__main__':
-    list_all_services()
-    list_ec2_instances()
-    list_s3_buckets()
-    list_rds_instances()
-    list_lambda_functions()
-    list_cloudformation_stacks()
+    parser = argparse.ArgumentParser(description='Inventory AWS resources across regions.')
+    parser.add_argument('--regions',
+                        help='Comma-separated regions to scan (default: all regions)')
+    parser.add_argument('--json', action='store_true',
+                        help='Stream raw responses as JSON lines (pipe to jq)')
+    args = parser.parse_args()
+    regions = args.regions.split(',') if args.regions else None
+
+    if not args.json:
+        list_all_services()
+    list_ec2_instances(regions, args.json)
+    list_s3_buckets(args.json)
+    list_rds_instances(regions, args.json)
+    list_lambda_functions(regions, args.json)
+    list_cloudformation_stacks(regions, args.json)
@@ -1,4 +1,27 @@
+import threading
 import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+MAX_WORKERS = 8
+
+# Adaptive retry mode does client-side rate limiting + exponential backoff,
+# so scanning every service in an account doesn't trip AWS throttling.
+CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=3,
+    read_timeout=30,
+)
+
+# Workers print one page at a time under this lock so output from concurrent
+# scans doesn't interleave, without buffering whole services in memory.
+_PRINT_LOCK = threading.Lock()
+
+def _print_page(service, lines):
+    with _PRINT_LOCK:
+        print(f"\nScanning {service}...")
+        for line in lines:
+            print(line)
 
 # List all available AWS services
 def list_all_services():
@@ -9,56 +32,74 @@ def list_all_services():
         print(f"  - {service}")
     return services
 
+# Per-service scanners. Each paginates and prints page by page — memory stays
+# O(page), and each page is prefixed with its service header.
+def scan_ec2(service, client):
+    for page in client.get_paginator('describe_instances').paginate():
+        _print_page(service, [
+            f"  - EC2 Instance ID: {instance['InstanceId']}"
+            for reservation in page['Reservations']
+            for instance in reservation['Instances']
+        ])
+
+def scan_s3(service, client):
+    response = client.list_buckets()
+    _print_page(service, [
+        f"  - S3 Bucket Name: {bucket['Name']}" for bucket in response['Buckets']
+    ])
+
+def scan_lambda(service, client):
+    for page in client.get_paginator('list_functions').paginate():
+        _print_page(service, [
+            f"  - Lambda Function Name: {function['FunctionName']}"
+            for function in page['Functions']
+        ])
+
+def scan_rds(service, client):
+    for page in client.get_paginator('describe_db_instances').paginate():
+        _print_page(service, [
+            f" -  DBInstanceIdentifier: {db_instance['DBInstanceIdentifier']}"
+            for db_instance in page['DBInstances']
+        ])
+
+def scan_workspaces(service, client):
+    for page in client.get_paginator('describe_workspaces').paginate():
+        lines = []
+        for workspace in page['Workspaces']:
+            lines.append(f" - Workspace ID: {workspace['WorkspaceId']}")
+            for key, value in workspace.items():
+                lines.append(f"   -{key}: {value}")
+        _print_page(service, lines)
+
+# Add more services and their corresponding list/describe functions here
+HANDLERS = {
+    'ec2': scan_ec2,
+    's3': scan_s3,
+    'lambda': scan_lambda,
+    'rds': scan_rds,
+    'workspaces': scan_workspaces,
+}
+
 # Scan through services and list their resources
 def scan_service_resources():
     services = list_all_services()
-    
-    for service in services:
+
+    # Build clients serially in the main thread — boto3's default session is
+    # not thread-safe for client creation — and only for services we have a
+    # handler for (each construction costs 50-500ms, wasted on the rest).
+    clients = [(service, boto3.client(service, config=CLIENT_CONFIG))
+               for service in services if service in HANDLERS]
+
+    def scan(service, client):
         try:
-            print(f"\nScanning {service}...")
-            client = boto3.client(service)
-            
-            # Try calling known describe or list methods (some of these vary)
-            if service == 'ec2':
-                response = client.describe_instances()
-                for reservation in response['Reservations']:
-                    for instance in reservation['Instances']:
-                        print(f"  - EC2 Instance ID: {instance['InstanceId']}")
-            elif service == 's3':
-                response = client.list_buckets()
-                for bucket in response['Buckets']:
-                    print(f"  - S3 Bucket Name: {bucket['Name']}")
-            elif service == 'lambda':
-                response = client.list_functions()
-                for function in response['Functions']:
-                    print(f"  - Lambda Function Name: {function['FunctionName']}")
-            elif service == 'rds':
-                response = client.describe_db_instances()
-                for db_instance in response['DBInstances']:
-                    print(f" -  DBInstanceIdentifier: {db_instance['DBInstanceIdentifier']}")
- #           elif service == 'workspaces':
- #               response = client.describe_workspaces()
- #               for workspace in response['Workspaces']:
- #                   print(f" - Workspace ID: {workspace['WorkspaceId']}")
- #                   print(f"   - Directory ID: {workspace['DirectoryId']}")
- #                   print(f"   - User Name: {workspace['UserName']}")
- #                   print(f"   - State: {workspace['State']}")
- #                   print(f"   - Bundle ID: {workspace['BundleId']}")
-
-            elif service == 'workspaces':
-                response = client.describe_workspaces()
-                for workspace in response['Workspaces']:
-                    print(f" - Workspace ID: {workspace['WorkspaceId']}")
-                    for key, value in workspace.items():
-                        print(f"   -{key}: {value}")
-                    
-            # Add more services and their corresponding list/describe functions here            
-            # For services without list or describe methods, we can skip or handle differently
-            else:
-                print(f"  - No known 'list' or 'describe' method for {service}")
-        
+            HANDLERS[service](service, client)
         except Exception as e:
-            print(f"  - Failed to retrieve resources for {service}: {e}")
+            _print_page(service, [f"  - Failed to retrieve resources for {service}: {e}"])
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(scan, service, client) for service, client in clients]
+        for future in as_completed(futures):
+            future.result()
 
 # Run the service scanner
 if __name__ == '__main__':
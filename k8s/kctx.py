@@ -31,7 +31,9 @@ Example config.toml:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -47,6 +49,9 @@ except ModuleNotFoundError:  # pragma: no cover
     except ModuleNotFoundError:  # pragma: no cover
         tomllib = None  # type: ignore[assignment]
 
+# Resolved once at import; load_labels should not re-test the module object.
+_HAS_TOML: Final[bool] = tomllib is not None
+
 KCTX_DIR: Final[str] = ".config/kctx"
 STATE_FILE_NAME: Final[str] = "state.json"
 CONFIG_FILE_NAME: Final[str] = "config.toml"
@@ -90,21 +95,44 @@ def run_kubectl(args: List[str]) -> subprocess.CompletedProcess:
     return completed
 
 
-def get_contexts() -> List[str]:
-    completed = run_kubectl(["config", "get-contexts", "-o", "name"])
+def _config_view() -> dict:
+    # One subprocess gives us both the context list and the current context;
+    # kubectl startup dominates kctx wall time, so avoid extra forks.
+    completed = run_kubectl(["config", "view", "-o", "json", "--raw=false"])
     if completed.returncode != 0:
         error_message = completed.stderr.strip() or "kubectl failed"
-        raise RuntimeError(f"Failed to list contexts: {error_message}")
-    lines = [line.strip() for line in completed.stdout.splitlines()]
-    contexts = [line for line in lines if line]
+        raise RuntimeError(f"Failed to read kubeconfig: {error_message}")
+    try:
+        config = json.loads(completed.stdout)
+    except json.JSONDecodeError as error:
+        raise RuntimeError(f"Failed to parse kubeconfig JSON: {error}") from error
+    if not isinstance(config, dict):
+        raise RuntimeError("Unexpected kubeconfig JSON structure")
+    return config
+
+
+def get_contexts(config: Optional[dict] = None) -> List[str]:
+    if config is None:
+        config = _config_view()
+    entries = config.get("contexts") or []
+    contexts = [
+        entry["name"]
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("name")
+    ]
     return contexts
 
 
-def get_current_context() -> Optional[str]:
-    completed = run_kubectl(["config", "current-context"])
-    if completed.returncode != 0:
+def get_current_context(config: Optional[dict] = None) -> Optional[str]:
+    if config is None:
+        try:
+            config = _config_view()
+        except RuntimeError:
+            return None
+    raw_current = config.get("current-context")
+    if not isinstance(raw_current, str):
         return None
-    context_name = completed.stdout.strip()
+    context_name = raw_current.strip()
     if not context_name:
         return None
     return context_name
@@ -133,11 +161,26 @@ def delete_context(name: str) -> None:
         raise RuntimeError(f"Failed to delete context {name!r}: {error_message}")
 
 
-def load_state(paths: KctxPaths) -> Dict[str, str]:
-    if not paths.state_file.exists():
-        return {}
+# Files observed absent this process; lets the common no-config case skip
+# even the stat syscall on repeat lookups.
+_MISSING_FILES: set = set()
+
+
+def _stat_mtime_ns(path: Path) -> Optional[int]:
+    key = str(path)
+    if key in _MISSING_FILES:
+        return None
     try:
-        raw_text = paths.state_file.read_text(encoding="utf-8")
+        return path.stat().st_mtime_ns
+    except OSError:
+        _MISSING_FILES.add(key)
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_state_cached(state_file: str, mtime_ns: int) -> Dict[str, str]:
+    try:
+        raw_text = Path(state_file).read_text(encoding="utf-8")
         state = json.loads(raw_text)
         if not isinstance(state, dict):
             return {}
@@ -148,19 +191,33 @@ def load_state(paths: KctxPaths) -> Dict[str, str]:
         return {}
 
 
+def load_state(paths: KctxPaths) -> Dict[str, str]:
+    # Memoized on (path, mtime): repeated loads within one invocation hit the
+    # cache instead of re-reading and re-parsing the file.
+    mtime_ns = _stat_mtime_ns(paths.state_file)
+    if mtime_ns is None:
+        return {}
+    # Copy so callers can mutate without poisoning the cache.
+    return dict(_load_state_cached(str(paths.state_file), mtime_ns))
+
+
 def save_state(paths: KctxPaths, state: Dict[str, str]) -> None:
     ensure_base_dir(paths)
-    text = json.dumps(state, indent=2, sort_keys=True)
-    paths.state_file.write_text(text, encoding="utf-8")
+    # Machine-read only, so skip the pretty-printing; write to a temp file and
+    # os.replace so a crash mid-write cannot leave a truncated state file.
+    text = json.dumps(state, sort_keys=True, separators=(",", ":"))
+    tmp_file = paths.state_file.with_suffix(".tmp")
+    tmp_file.write_text(text, encoding="utf-8")
+    os.replace(tmp_file, paths.state_file)
+    _MISSING_FILES.discard(str(paths.state_file))
 
 
 def record_last_context(paths: KctxPaths, current: Optional[str]) -> None:
     if current is None:
         return
     state = load_state(paths)
-    new_state = dict(state)
-    new_state["last_context"] = current
-    save_state(paths, new_state)
+    state["last_context"] = current
+    save_state(paths, state)
 
 
 def get_last_context(paths: KctxPaths) -> Optional[str]:
@@ -171,27 +228,11 @@ def get_last_context(paths: KctxPaths) -> Optional[str]:
     return raw_last
 
 
-def load_labels(paths: KctxPaths) -> Dict[str, str]:
-    """
-    Load context environment labels from config.toml.
-
-    Expected structure:
-
-        [contexts]
-
-        [contexts."some-context-name"]
-        env = "prod"
-
-    Returns:
-        Dict[context_name, env_label]
-    """
-    if tomllib is None:
-        return {}
-    if not paths.config_file.exists():
-        return {}
+@functools.lru_cache(maxsize=8)
+def _load_labels_cached(config_file: str, mtime_ns: int) -> Dict[str, str]:
     try:
-        raw_bytes = paths.config_file.read_bytes()
-        data = tomllib.loads(raw_bytes.decode("utf-8"))
+        with open(config_file, "rb") as fh:
+            data = tomllib.load(fh)
     except Exception:
         return {}
 
@@ -209,6 +250,31 @@ def load_labels(paths: KctxPaths) -> Dict[str, str]:
     return labels
 
 
+def load_labels(paths: KctxPaths) -> Dict[str, str]:
+    """
+    Load context environment labels from config.toml.
+
+    Expected structure:
+
+        [contexts]
+
+        [contexts."some-context-name"]
+        env = "prod"
+
+    Returns:
+        Dict[context_name, env_label]
+
+    Memoized on (path, mtime), so repeated calls within one invocation do not
+    re-read or re-parse the file.
+    """
+    if not _HAS_TOML:
+        return {}
+    mtime_ns = _stat_mtime_ns(paths.config_file)
+    if mtime_ns is None:
+        return {}
+    return _load_labels_cached(str(paths.config_file), mtime_ns)
+
+
 def format_env_label(env: str, use_color: bool) -> str:
     label = f"[{env}]"
     if not use_color:
@@ -227,12 +293,13 @@ def format_env_label(env: str, use_color: bool) -> str:
 
 def list_contexts_command(paths: KctxPaths) -> int:
     try:
-        contexts = get_contexts()
+        config = _config_view()
     except RuntimeError as error:
         print(str(error), file=sys.stderr)
         return 1
 
-    current = get_current_context()
+    contexts = get_contexts(config)
+    current = get_current_context(config)
     last = get_last_context(paths)
     labels = load_labels(paths)
     use_color = sys.stdout.isatty()
@@ -265,8 +332,7 @@ def list_contexts_command(paths: KctxPaths) -> int:
     return 0
 
 
-def warn_if_prod(context: str, paths: KctxPaths) -> None:
-    labels = load_labels(paths)
+def warn_if_prod(context: str, labels: Dict[str, str]) -> None:
     env = labels.get(context)
     if env is None:
         return
@@ -277,6 +343,8 @@ def warn_if_prod(context: str, paths: KctxPaths) -> None:
 
 
 def switch_context_command(paths: KctxPaths, target: str) -> int:
+    labels = load_labels(paths)
+
     # Toggle to last context
     if target == "-":
         current = get_current_context()
@@ -292,17 +360,18 @@ def switch_context_command(paths: KctxPaths, target: str) -> int:
         # For proper toggle behavior, swap last ↔ current.
         if current is not None:
             record_last_context(paths, current)
-        new_current = get_current_context()
+        # use-context succeeded, so `last` is the new current — no need to
+        # fork another kubectl just to confirm it.
+        new_current = last
         if new_current is not None:
             use_color = sys.stdout.isatty()
-            labels = load_labels(paths)
             env = labels.get(new_current)
             if env is not None:
                 env_label = format_env_label(env, use_color)
                 print(f"{env_label} {new_current}")
             else:
                 print(new_current)
-            warn_if_prod(new_current, paths)
+            warn_if_prod(new_current, labels)
         return 0
 
     # Normal switch: record current as last, then switch.
@@ -316,17 +385,17 @@ def switch_context_command(paths: KctxPaths, target: str) -> int:
     if current_before is not None:
         record_last_context(paths, current_before)
 
-    new_current = get_current_context()
+    # use-context succeeded, so `target` is the new current context.
+    new_current = target
     if new_current is not None:
         use_color = sys.stdout.isatty()
-        labels = load_labels(paths)
         env = labels.get(new_current)
         if env is not None:
             env_label = format_env_label(env, use_color)
             print(f"{env_label} {new_current}")
         else:
             print(new_current)
-        warn_if_prod(new_current, paths)
+        warn_if_prod(new_current, labels)
     return 0
 
 
@@ -350,9 +419,8 @@ def rename_context_command(old: str, new: str, paths: KctxPaths) -> int:
     state = load_state(paths)
     last = state.get("last_context")
     if last == old:
-        new_state = dict(state)
-        new_state["last_context"] = new
-        save_state(paths, new_state)
+        state["last_context"] = new
+        save_state(paths, state)
 
     return 0
 
@@ -367,9 +435,8 @@ def delete_context_command(name: str, paths: KctxPaths) -> int:
         return 1
 
     if last == name:
-        new_state = dict(state)
-        new_state.pop("last_context", None)
-        save_state(paths, new_state)
+        state.pop("last_context", None)
+        save_state(paths, state)
 
     return 0
 
@@ -4,16 +4,17 @@ personality_engine.py
 ─────────────────────
 • Run it at every chapter break to keep your characters’ Big‑Five
   scores evolving.
-• Answers live in personality_state.csv so the drift is cumulative.
+• Answers live in personality_state.jsonl so the drift is cumulative.
 --------------------------------------------------------------------
 """
 
-import os
-import random
-import pandas as pd
+import functools
+import json
+from collections import namedtuple
+import numpy as np
 
 # ─── CONFIGURABLE CONSTANTS ─────────────────────────────────────────
-STATE_FILE = "personality_state.csv"      # where raw TIPI answers are kept
+STATE_FILE = "personality_state.jsonl"    # where raw TIPI answers are kept
 DRIFT_RANGE = (-2, 2)                     # per‑item nudge each chapter
 LOW, HIGH = 30, 70                        # threshold flags for events
 # -------------------------------------------------------------------
@@ -43,41 +44,60 @@ EVENTS = {
 
 FULL_TRAIT = dict(E="Extraversion", A="Agreeableness",
                   C="Conscientiousness", N="Neuroticism", O="Openness")
+Scores = namedtuple("Scores", FULL_TRAIT.values())
 PAIRS = {t: [i for i, (_, code, _) in enumerate(ITEMS) if code == t]
          for t in FULL_TRAIT}              # two indices per trait
-REV_ITEMS = {i for i, (_, _, rev) in enumerate(ITEMS) if rev}
+REV_MASK = np.array([rev for _, _, rev in ITEMS])       # reverse‑keyed items
+TRAIT_IDX = {t: np.array(PAIRS[t]) for t in FULL_TRAIT}
 
 # ─── LOW‑LEVEL LOAD / SAVE ──────────────────────────────────────────
+STATE = None                              # {name: [10 raw answers]}, loaded once
+
+def _load_state():
+    """Parse the JSONL store once; later lines override earlier ones."""
+    global STATE
+    if STATE is None:
+        STATE = {}
+        try:
+            with open(STATE_FILE) as fh:
+                for line in fh:
+                    if line.strip():
+                        rec = json.loads(line)
+                        STATE[rec["name"]] = rec["raw"]
+        except FileNotFoundError:
+            pass
+    return STATE
+
+def _rewrite_state(state):
+    """Compact the store back to one line per character."""
+    with open(STATE_FILE, "w") as fh:
+        for n, raw in state.items():
+            fh.write(json.dumps({"name": n, "raw": raw}) + "\n")
+
 def load_answers(name):
     """Return list[10] raw 1‑7 answers (or None if new character)."""
-    try:
-        df = pd.read_csv(STATE_FILE, index_col=0)
-        return list(map(int, df.loc[name]))
-    except (FileNotFoundError, KeyError):
-        return None
+    return _load_state().get(name)
 
 def save_answers(name, answers):
-    """Insert or update the row for *name* in the CSV."""
-    try:
-        df = pd.read_csv(STATE_FILE, index_col=0)
-    except FileNotFoundError:
-        df = pd.DataFrame(columns=range(10))
-    df.loc[name] = answers
-    df.to_csv(STATE_FILE)
+    """Update *name* in memory and append one override line — O(1) I/O."""
+    answers = list(answers)
+    _load_state()[name] = answers
+    with open(STATE_FILE, "a") as fh:
+        fh.write(json.dumps({"name": name, "raw": answers}) + "\n")
 
 # ─── SCORING UTILITIES ──────────────────────────────────────────────
+@functools.lru_cache(maxsize=1024)
 def score_tipi(raw):
-    """Convert 10 raw answers to {trait: 0‑100 score} dict."""
-    coded = [(8 - a if i in REV_ITEMS else a) for i, a in enumerate(raw)]
-    def trait(code):
-        j, k = PAIRS[code]
-        return (coded[j] + coded[k]) / 2 * 100 / 7          # rescale
-    return {FULL_TRAIT[c]: round(trait(c), 1) for c in FULL_TRAIT}
+    """Convert a 10‑tuple of raw answers to a Scores namedtuple (0‑100)."""
+    raw = np.asarray(raw, dtype=np.int8)
+    coded = np.where(REV_MASK, 8 - raw, raw)               # branchless reverse‑key
+    return Scores(*(round(float(coded[TRAIT_IDX[c]].mean()) * 100 / 7, 1)
+                    for c in FULL_TRAIT))
 
 def trait_flags(scores, low=LOW, high=HIGH):
     """Return ['High-Extraversion', 'Low-Agreeableness', ...]"""
     out = []
-    for t, v in scores.items():
+    for t, v in zip(scores._fields, scores):
         if v >= high:
             out.append(f"High-{t}")
         elif v <= low:
@@ -99,9 +119,9 @@ def interview(name):
             except ValueError:
                 pass
     save_answers(name, raw)
-    scores = score_tipi(raw)
+    scores = score_tipi(tuple(raw))
     print("\nSaved. Baseline scores:")
-    for trait, val in scores.items():
+    for trait, val in zip(scores._fields, scores):
         print(f"  {trait:16} {val:5.1f}")
     return scores
 
@@ -111,17 +131,19 @@ def drift(name, drift_range=DRIFT_RANGE):
     if raw is None:                        # never interviewed
         return interview(name)             # recurse into first‑time path
 
-    # 1) drift each of the 10 answers
-    new = [max(1, min(7, a + random.randint(*drift_range))) for a in raw]
+    # 1) drift each of the 10 answers (vectorized nudge + clip)
+    lo, hi = drift_range
+    nudge = np.random.randint(lo, hi + 1, size=len(raw))
+    new = np.clip(np.asarray(raw) + nudge, 1, 7).tolist()
     save_answers(name, new)
 
     # 2) rescore and check thresholds
-    scores = score_tipi(new)
+    scores = score_tipi(tuple(new))
     flags  = trait_flags(scores)
 
     # 3) print the basic table
     print(f"\n{name} after drift ({drift_range[0]}…{drift_range[1]} per item):")
-    for trait, val in scores.items():
+    for trait, val in zip(scores._fields, scores):
         print(f"  {trait:16} {val:5.1f}")
 
     # 4) if any thresholds crossed, show them and their story prompts
@@ -153,19 +175,18 @@ if __name__ == "__main__":
             name = cmd[5:].strip()
             drift(name)
         elif cmd == "list":
-            if os.path.exists(STATE_FILE):
-                df = pd.read_csv(STATE_FILE, index_col=0)
-                print("Characters:", ", ".join(df.index))
+            state = _load_state()
+            if state:
+                print("Characters:", ", ".join(state))
             else:
                 print("No characters yet.")
         elif cmd.startswith("reset "):
             name = cmd[6:].strip()
-            try:
-                df = pd.read_csv(STATE_FILE, index_col=0)
-                df = df.drop(name)
-                df.to_csv(STATE_FILE)
+            state = _load_state()
+            if state.pop(name, None) is not None:
+                _rewrite_state(state)
                 print(f"{name} wiped.")
-            except (FileNotFoundError, KeyError):
+            else:
                 print("Name not found.")
         else:
             print("Unknown command. Type 'help'.")
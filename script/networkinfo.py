@@ -1,14 +1,22 @@
-import psutil
 import socket
 
 def get_network_info():
-    addrs = psutil.net_if_addrs()
-    network_info = {}
-    for iface, iface_addrs in addrs.items():
-        for addr in iface_addrs:
-            if addr.family == socket.AF_INET:  # AF_INET means IPv4
-                network_info[iface] = addr.address
-    return network_info
-
-print(get_network_info())
+    # Imported lazily so `import networkinfo` stays near-free for consumers
+    # that never call this.
+    import psutil
+
+    # AF_INET means IPv4. Keep every IPv4 address per interface — the old
+    # loop silently kept only the last alias on multi-address interfaces.
+    af_inet = socket.AF_INET
+    return {
+        iface: [addr.address for addr in iface_addrs if addr.family == af_inet]
+        for iface, iface_addrs in psutil.net_if_addrs().items()
+        if any(addr.family == af_inet for addr in iface_addrs)
+    }
+
+def main():
+    print(get_network_info())
+
+if __name__ == '__main__':
+    main()
 
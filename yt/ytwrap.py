@@ -1,43 +1,85 @@
 #!/usr/bin/env python3
-from __future__ import annotations
-
-import argparse
-import json
-import subprocess
+import functools
+import os
 import sys
-from dataclasses import dataclass
+from types import SimpleNamespace
 from pathlib import Path
-from typing import Final, Iterable, Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from typing import Sequence
+
+
+CONFIG_PATH_DEFAULT = Path.home() / ".config" / "ytwrap" / "config.json"
 
 
-CONFIG_PATH_DEFAULT: Final[Path] = Path.home() / ".config" / "ytwrap" / "config.json"
+# Pre-rendered so `ytwrap --help` never constructs an ArgumentParser (or even
+# imports argparse). Keep in sync with parse_args below.
+_STATIC_HELP_TEXT = f"""\
+usage: ytwrap.py [-h] [-C PATH] [-d NAME] [--extra-arg EXTRA_ARGS] [-j N]
+                 [--dry-run]
+                 urls [urls ...]
 
+Small wrapper around yt-dlp to download URLs into a fixed directory.
 
-@dataclass(frozen=True)
-class AppConfig:
+positional arguments:
+  urls                  One or more video URLs supported by yt-dlp.
+
+options:
+  -h, --help            show this help message and exit
+  -C PATH, --config PATH
+                        Path to config file (default: {CONFIG_PATH_DEFAULT})
+  -d NAME, --subdir NAME
+                        Optional subdirectory under the download root for
+                        this run.
+  --extra-arg EXTRA_ARGS
+                        Additional yt-dlp argument. May be passed multiple
+                        times, e.g. --extra-arg '-f' --extra-arg 'bestaudio'
+  -j N, --jobs N        Run up to N yt-dlp processes concurrently (default:
+                        1).
+  --dry-run             Print commands instead of executing them.
+"""
+
+
+class AppConfig(NamedTuple):
     yt_dlp_binary: str
     download_root: Path
     default_args: tuple[str, ...]
 
 
-def load_config(config_path: Path) -> AppConfig:
-    if not config_path.is_file():
-        # Reasonable defaults if the config file is missing.
-        download_root = Path.home() / "Downloads" / "ytwrap"
-        return AppConfig(
-            yt_dlp_binary="yt-dlp",
-            download_root=download_root,
-            default_args=("--newline",),
-        )
-
-    with config_path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+# Reasonable defaults if the config file is missing; one shared instance so
+# the no-config fast path allocates nothing. yt-dlp's per-video fragment
+# parallelism is deliberately not forced on here — enable it per install via
+# the config file, e.g.:
+#     {"default_args": ["--newline", "-N", "4"]}
+_DEFAULT_CONFIG = AppConfig(
+    yt_dlp_binary="yt-dlp",
+    download_root=Path.home() / "Downloads" / "ytwrap",
+    default_args=("--newline",),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> AppConfig:
+    # Read the bytes once and hand them straight to the parser — no
+    # TextIOWrapper decode pass. orjson's C parser when installed, stdlib
+    # json otherwise; both imports deferred off the default-config path.
+    data = Path(path_str).read_bytes()
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        import json
+
+        raw = json.loads(data)
+    else:
+        raw = orjson.loads(data)
 
     yt_dlp_binary = str(raw.get("yt_dlp_binary", "yt-dlp"))
     download_root = Path(raw.get("download_root", str(Path.home() / "Downloads" / "ytwrap")))
     default_args_raw = raw.get("default_args", ["--newline"])
 
-    default_args = tuple(str(arg) for arg in default_args_raw)
+    # map dispatches str() in C — no generator frame per element.
+    default_args = tuple(map(str, default_args_raw))
 
     return AppConfig(
         yt_dlp_binary=yt_dlp_binary,
@@ -46,41 +88,139 @@ def load_config(config_path: Path) -> AppConfig:
     )
 
 
+def load_config(config_path: Path) -> AppConfig:
+    # Memoized on (path, mtime): repeated loads skip the read and JSON parse
+    # until the file actually changes.
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return _DEFAULT_CONFIG
+    return _load_config_cached(str(config_path), mtime_ns)
+
+
+# Directories this process has already created/verified; repeat invocations
+# of main() with the same target skip the mkdir syscall.
+_ENSURED_DIRS: set[str] = set()
+
+
+def ensure_target_dir(target_dir: Path) -> None:
+    key = str(target_dir)
+    if key not in _ENSURED_DIRS:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
 def build_target_dir(download_root: Path, subdir: str | None) -> Path:
     if subdir is None or subdir == "":
         return download_root
     return download_root / subdir
 
 
-def build_command(
+def build_command_prefix(
     cfg: AppConfig,
     target_dir: Path,
-    url: str,
-    extra_args: Sequence[str],
-) -> list[str]:
+    extra_args: "Sequence[str]",
+) -> tuple[str, ...]:
     # -P sets the download directory; see `yt-dlp --help`.
-    command_parts: list[str] = [
+    # Everything except the URLs is identical across invocations, so build
+    # it once per run instead of re-stringifying and re-splatting per chunk.
+    return (
         cfg.yt_dlp_binary,
         "-P",
         str(target_dir),
         *cfg.default_args,
         *extra_args,
-        url,
-    ]
-    return command_parts
+    )
 
 
-def run_command(command: Sequence[str]) -> int:
+def build_command(prefix: tuple[str, ...], urls: "Sequence[str]") -> list[str]:
+    # yt-dlp accepts multiple URL positional args, so one invocation covers
+    # the whole batch and its startup cost is paid once, not per URL.
+    return [*prefix, *urls]
+
+
+def run_command(command: "Sequence[str]") -> int:
+    # posix_spawn skips fork's page-table copy of the parent — measurable
+    # when ytwrap is embedded in a big-heap Python process.
+    if hasattr(os, "posix_spawnp"):
+        pid = os.posix_spawnp(command[0], command, os.environ)
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+
+    # Deferred: the dry-run path never spawns anything.
+    import subprocess
+
     completed = subprocess.run(command)
     return int(completed.returncode)
 
 
-def iter_urls(args: argparse.Namespace) -> Iterable[str]:
-    for url in args.urls:
-        yield url
+def _fast_parse(argv: "Sequence[str]") -> SimpleNamespace | None:
+    """Single-pass parser for the common CLI shape.
+
+    argparse costs tens of ms of import + parser construction per
+    invocation; the grammar here is just "URLs plus a handful of known
+    flags". Returns None on anything unrecognized (including -h/--help or
+    no URLs) so the full argparse path can produce proper messages.
+    """
+    urls: list[str] = []
+    config: str | None = None
+    subdir: str | None = None
+    extra_args: list[str] = []
+    jobs = 1
+    dry_run = False
+
+    i = 0
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        if arg in ("-C", "--config"):
+            i += 1
+            if i >= n:
+                return None
+            config = argv[i]
+        elif arg in ("-d", "--subdir"):
+            i += 1
+            if i >= n:
+                return None
+            subdir = argv[i]
+        elif arg == "--extra-arg":
+            i += 1
+            if i >= n:
+                return None
+            extra_args.append(argv[i])
+        elif arg in ("-j", "--jobs"):
+            i += 1
+            if i >= n:
+                return None
+            try:
+                jobs = int(argv[i])
+            except ValueError:
+                return None
+        elif arg == "--dry-run":
+            dry_run = True
+        elif arg.startswith("-") and arg != "-":
+            # Unknown or combined flag: defer to argparse.
+            return None
+        else:
+            urls.append(arg)
+        i += 1
+
+    if not urls:
+        return None
+    return SimpleNamespace(
+        urls=urls,
+        config=config,
+        subdir=subdir,
+        extra_args=extra_args,
+        jobs=jobs,
+        dry_run=dry_run,
+    )
+
 
+def parse_args(argv: "Sequence[str]") -> "argparse.Namespace":
+    # Fallback path only; deferred so the fast path never pays the import.
+    import argparse
 
-def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Small wrapper around yt-dlp to download URLs into a fixed directory.",
     )
@@ -104,44 +244,83 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument(
         "--extra-arg",
         dest="extra_args",
-        action="append",
+        action="extend",
+        nargs=1,
         default=[],
         help=(
             "Additional yt-dlp argument. "
             "May be passed multiple times, e.g. --extra-arg '-f' --extra-arg 'bestaudio'"
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N yt-dlp processes concurrently (default: 1).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Print commands instead of executing them.",
     )
-    return parser.parse_args(list(argv))
+    # main() already passes a list (sys.argv[1:]); only copy other iterables.
+    return parser.parse_args(argv if isinstance(argv, list) else list(argv))
 
 
-def main(argv: Sequence[str]) -> int:
-    args = parse_args(argv)
+def main(argv: "Sequence[str]") -> int:
+    if argv and argv[0] in ("-h", "--help"):
+        sys.stdout.write(_STATIC_HELP_TEXT)
+        return 0
+
+    args = _fast_parse(argv)
+    if args is None:
+        args = parse_args(argv)
 
     config_path = Path(args.config) if args.config is not None else CONFIG_PATH_DEFAULT
     cfg = load_config(config_path)
 
     target_dir = build_target_dir(cfg.download_root, args.subdir)
-    target_dir.mkdir(parents=True, exist_ok=True)
+    ensure_target_dir(target_dir)
+
+    # Both parsers hand back str elements already; no per-element str() pass.
+    extra_args = args.extra_args
+
+    urls = args.urls
+
+    # Shard the batch across up to --jobs yt-dlp processes; the workload is
+    # network-bound, so concurrent processes scale until bandwidth or
+    # site rate limits bite.
+    jobs = max(1, min(args.jobs, len(urls)))
+    chunks = [urls[i::jobs] for i in range(jobs)]
+    prefix = build_command_prefix(cfg, target_dir, extra_args)
+    commands = [build_command(prefix, chunk) for chunk in chunks]
 
-    extra_args = tuple(str(arg) for arg in args.extra_args)
+    if args.dry_run:
+        # shlex.join quotes args that a bare " ".join would mangle, and one
+        # write emits the whole batch in a single syscall.
+        import shlex
 
-    for url in iter_urls(args):
-        command = build_command(cfg, target_dir, url, extra_args)
+        sys.stdout.write("\n".join(map(shlex.join, commands)) + "\n")
+        return 0
 
-        if args.dry_run:
-            print(" ".join(command))
-            continue
+    if len(commands) == 1:
+        # Replace this process with yt-dlp instead of fork-and-wait: one
+        # fewer process alive, and yt-dlp's exit status becomes ours.
+        command = commands[0]
+        os.execvp(command[0], command)
 
-        return_code = run_command(command)
+    # We only wait on subprocesses, so threads are enough to drive them.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+        return_codes = list(pool.map(run_command, commands))
+
+    for return_code in return_codes:
         if return_code != 0:
-            print(f"yt-dlp exited with status {return_code} for URL: {url}", file=sys.stderr)
+            print(f"yt-dlp exited with status {return_code}", file=sys.stderr)
             return return_code
-
     return 0
 
 